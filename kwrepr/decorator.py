@@ -49,7 +49,9 @@ def apply_kwrepr(
         Callable[[type], type] | type: The decorated class or a decorator function.
 
     Raises:
-        Any exceptions raised by `KWRepr.inject_repr`.
+        ValueError: If both `include` and `exclude` are provided.
+        TypeError: If the class does not define `__dict__` or `__slots__`.
+        Both are raised when the class is decorated, not on the first repr() call.
 
     Notes:
         This is a thin wrapper around `KWRepr.inject_repr`. It exists for syntactic sugar and usability.
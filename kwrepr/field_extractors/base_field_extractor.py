@@ -1,14 +1,49 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
+from inspect import getmro
 from reprlib import Repr
 from typing import Any
 
-from kwrepr.types import Instance
+from kwrepr.types import Class, Instance
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=128)
+def _get_field_value_repr(repr_config: frozenset[tuple[str, Any]]) -> Repr:
+    # Shared between extractors; never mutate the returned object.
+    return Repr(**dict(repr_config))
 
 
 class BaseFieldExtractor(ABC):
+    __slots__ = (
+        "include",
+        "exclude",
+        "compute",
+        "format_spec",
+        "exclude_private",
+        "skip_missing",
+        "resolved_fields",
+        "_field_value_repr",
+        "_plain_repr_types",
+        "_default_field_handler",
+        "_field_handlers",
+        "_field_plan"
+    )
+
+    SPECIAL_SLOTS: frozenset[str] = frozenset({"__dict__", "__weakref__"})
+
+    # Longest builtin repr() of scalar types that reprlib would only truncate.
+    PLAIN_REPR_WIDTHS: dict[type, int] = {
+        type(None): 4,
+        bool: 5,
+        float: 24
+    }
+
     def __init__(
         self,
+        class_: Class,
         *,
         include: Sequence[str] | None = None,
         exclude: Sequence[str] | None = None,
@@ -18,19 +53,76 @@ class BaseFieldExtractor(ABC):
         skip_missing: bool = False,
         repr_config: Mapping[str, Any] | None = None
     ) -> None:
-        self.include = include or []
-        self.exclude = exclude or []
+        self.include: tuple[str, ...] = tuple(include or ())
+        self.exclude: frozenset[str] = frozenset(exclude or ())
         self.compute = compute or {}
         self.format_spec = format_spec or {}
         self.exclude_private = exclude_private
         self.skip_missing = skip_missing
 
-        self._field_value_repr: Repr = Repr(**(repr_config or {}))
+        try:
+            self._field_value_repr: Repr = _get_field_value_repr(frozenset((repr_config or {}).items()))
+        except TypeError:
+            self._field_value_repr = Repr(**(repr_config or {}))
+        self._plain_repr_types: frozenset[type] = frozenset(
+            field_type
+            for field_type, width in self.PLAIN_REPR_WIDTHS.items()
+            if width <= self._field_value_repr.maxother
+        )
+
+        repr_field_value = self.repr_field_value
+        self._default_field_handler: Callable[[Instance, Any], str] = (
+            lambda inst, field_value: repr_field_value(field_value)
+        )
+
+        # Handlers only for fields named in compute or format_spec; every
+        # other field uses _default_field_handler.
+        self._field_handlers: dict[str, Callable[[Instance, Any], str]] = {
+            field_name: self.build_field_handler(field_name)
+            for field_name in self.compute.keys() | self.format_spec.keys()
+        }
+
+        self.resolved_fields: tuple[str, ...] | None = self.resolve_fields(class_)
+
+        self._field_plan: tuple[tuple[str, Callable[[Instance, Any], str]], ...] = (
+            self.build_field_plan(self.resolved_fields or ())
+        )
 
     @abstractmethod
-    def extract_fields(self, inst: Instance) -> Iterator[tuple[str, str]]:
+    def extract_fields(self, inst: Instance) -> list[str]:
         ...
 
+    def resolve_fields(self, class_: Class) -> tuple[str, ...] | None:
+        return None
+
+    def resolve_slot_fields(self, class_: Class) -> tuple[str, ...]:
+        resolved_fields: list[str] = []
+
+        for base in reversed(getmro(class_)):
+            slots = vars(base).get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+
+            for field_name in slots:
+                if field_name in self.SPECIAL_SLOTS:
+                    continue
+                if not self.is_field_allowed(field_name):
+                    continue
+
+                resolved_fields.append(self.mangle_field_name(base, field_name))
+
+        return tuple(resolved_fields)
+
+    @staticmethod
+    def mangle_field_name(class_: Class, field_name: str) -> str:
+        class_name = class_.__name__.lstrip("_")
+
+        # Python does not mangle names in classes named only with underscores.
+        if class_name and field_name.startswith("__") and not field_name.endswith("__"):
+            return f"_{class_name}{field_name}"
+
+        return field_name
+
     def is_field_allowed(self, field_name: str) -> bool:
         if field_name.startswith("_") and self.exclude_private:
             return False
@@ -39,16 +131,39 @@ class BaseFieldExtractor(ABC):
 
         return True
 
-    def process_field_value(self, inst: Instance, field_name: str, field_value: Any) -> str:
-        if field_computer := self.compute.get(field_name):
-            field_value = field_computer(inst)
+    def build_field_handler(self, field_name: str) -> Callable[[Instance, Any], str]:
+        field_computer = self.compute.get(field_name)
+        format_spec = self.format_spec.get(field_name)
+        repr_field_value = self.repr_field_value
+
+        if field_computer and format_spec:
+            return lambda inst, field_value: format(field_computer(inst), format_spec)
+        if field_computer:
+            return lambda inst, field_value: repr_field_value(field_computer(inst))
+        if format_spec:
+            return lambda inst, field_value: format(field_value, format_spec)
+
+        return self._default_field_handler
 
-        if format_spec := self.format_spec.get(field_name):
-            field_value = format(field_value, format_spec)
-        else:
-            field_value = self.repr_field_value(field_value)
+    def build_field_plan(
+        self,
+        field_names: Iterable[str]
+    ) -> tuple[tuple[str, Callable[[Instance, Any], str]], ...]:
+        default_field_handler = self._default_field_handler
 
-        return field_value
+        return tuple(
+            (field_name, self._field_handlers.get(field_name, default_field_handler))
+            for field_name in field_names
+        )
 
     def repr_field_value(self, field_value: Any) -> str:
+        field_type = type(field_value)
+
+        if field_type in self._plain_repr_types:
+            return repr(field_value)
+        if field_type is int:
+            field_value_repr = repr(field_value)
+            if len(field_value_repr) <= self._field_value_repr.maxlong:
+                return field_value_repr
+
         return self._field_value_repr.repr(field_value)
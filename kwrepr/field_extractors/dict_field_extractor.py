@@ -1,14 +1,17 @@
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
-from kwrepr.types import Instance
+from kwrepr.types import Class, Instance
 
-from .base_field_extractor import BaseFieldExtractor
+from .base_field_extractor import _MISSING, BaseFieldExtractor
 
 
 class DictFieldExtractor(BaseFieldExtractor):
+    __slots__ = ("_no_filter", "_slot_plan")
+
     def __init__(
         self,
+        class_: Class,
         *,
         include: Sequence[str] | None = None,
         exclude: Sequence[str] | None = None,
@@ -19,6 +22,7 @@ class DictFieldExtractor(BaseFieldExtractor):
         repr_config: Mapping[str, Any] | None = None
     ) -> None:
         super().__init__(
+            class_,
             include=include,
             exclude=exclude,
             compute=compute,
@@ -28,11 +32,50 @@ class DictFieldExtractor(BaseFieldExtractor):
             repr_config=repr_config
         )
 
-    def extract_fields(self, inst: Instance) -> Iterator[tuple[str, str]]:
-        for field_name, field_value in vars(inst).items():
-            if not self.is_field_allowed(field_name):
+        # Slots declared alongside `__dict__` in the MRO; shown first, when set.
+        self._slot_plan: tuple[tuple[str, Callable[[Instance, Any], str]], ...] = (
+            self.build_field_plan(self.resolve_slot_fields(class_))
+        )
+
+        # Every field is shown and repr'd as is, so no per-field checks are needed.
+        self._no_filter: bool = (
+            not self.exclude
+            and not self.exclude_private
+            and not self._field_handlers
+        )
+
+    def extract_fields(self, inst: Instance) -> list[str]:
+        fields: list[str] = []
+        append = fields.append
+
+        for field_name, field_handler in self._slot_plan:
+            field_value = getattr(inst, field_name, _MISSING)
+
+            if field_value is _MISSING:
+                continue
+
+            append(f"{field_name}={field_handler(inst, field_value)}")
+
+        if self._no_filter:
+            repr_field_value = self.repr_field_value
+            fields += [
+                f"{field_name}={repr_field_value(field_value)}"
+                for field_name, field_value in inst.__dict__.items()
+            ]
+            return fields
+
+        exclude = self.exclude
+        exclude_private = self.exclude_private
+        field_handlers = self._field_handlers
+        default_field_handler = self._default_field_handler
+
+        for field_name, field_value in inst.__dict__.items():
+            if field_name in exclude:
+                continue
+            if exclude_private and field_name.startswith("_"):
                 continue
 
-            field_value = self.process_field_value(inst, field_name, field_value)
+            field_handler = field_handlers.get(field_name, default_field_handler)
+            append(f"{field_name}={field_handler(inst, field_value)}")
 
-            yield field_name, field_value
+        return fields
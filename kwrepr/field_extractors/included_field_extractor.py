@@ -1,14 +1,17 @@
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
-from kwrepr.types import Instance
+from kwrepr.types import Class, Instance
 
 from .base_field_extractor import BaseFieldExtractor
 
 
 class IncludedFieldExtractor(BaseFieldExtractor):
+    __slots__ = ()
+
     def __init__(
         self,
+        class_: Class,
         *,
         include: Sequence[str] | None = None,
         exclude: Sequence[str] | None = None,
@@ -19,6 +22,7 @@ class IncludedFieldExtractor(BaseFieldExtractor):
         repr_config: Mapping[str, Any] | None = None
     ) -> None:
         super().__init__(
+            class_,
             include=include,
             exclude=exclude,
             compute=compute,
@@ -28,11 +32,17 @@ class IncludedFieldExtractor(BaseFieldExtractor):
             repr_config=repr_config
         )
 
-    def extract_fields(self, inst: Instance) -> Iterator[tuple[str, str]]:
-        for field_name in self.include:
-            if field_name.startswith("__") and not field_name.endswith("__"):
-                field_name = f"_{type(inst).__name__}{field_name}"
+    def resolve_fields(self, class_: Class) -> tuple[str, ...] | None:
+        return tuple(
+            self.mangle_field_name(class_, field_name)
+            for field_name in self.include
+        )
+
+    def extract_fields(self, inst: Instance) -> list[str]:
+        fields: list[str] = []
+        append = fields.append
 
+        for field_name, field_handler in self._field_plan:
             try:
                 field_value = getattr(inst, field_name)
             except AttributeError:
@@ -41,6 +51,6 @@ class IncludedFieldExtractor(BaseFieldExtractor):
 
                 raise AttributeError(f"Missing required attribute: {field_name}") from None
 
-            field_value = self.process_field_value(inst, field_name, field_value)
+            append(f"{field_name}={field_handler(inst, field_value)}")
 
-            yield field_name, field_value
+        return fields
@@ -1,14 +1,18 @@
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from operator import attrgetter
 from typing import Any
 
-from kwrepr.types import Instance
+from kwrepr.types import Class, Instance
 
-from .base_field_extractor import BaseFieldExtractor
+from .base_field_extractor import _MISSING, BaseFieldExtractor
 
 
 class SlotsFieldExtractor(BaseFieldExtractor):
+    __slots__ = ("_fields_getter",)
+
     def __init__(
         self,
+        class_: Class,
         *,
         include: Sequence[str] | None = None,
         exclude: Sequence[str] | None = None,
@@ -19,6 +23,7 @@ class SlotsFieldExtractor(BaseFieldExtractor):
         repr_config: Mapping[str, Any] | None = None
     ) -> None:
         super().__init__(
+            class_,
             include=include,
             exclude=exclude,
             compute=compute,
@@ -28,22 +33,37 @@ class SlotsFieldExtractor(BaseFieldExtractor):
             repr_config=repr_config
         )
 
-    def extract_fields(self, inst: Instance) -> Iterator[tuple[str, str]]:
-        for field_name in type(inst).__slots__:
-            if not self.is_field_allowed(field_name):
-                continue
+        # Fetches every slot in one call; with a single name attrgetter
+        # returns the bare value instead of a tuple, so it is not used then.
+        self._fields_getter: Callable[[Instance], tuple[Any, ...]] | None = None
+        if not self.skip_missing and len(self.resolved_fields) > 1:
+            self._fields_getter = attrgetter(*self.resolved_fields)
+
+    def resolve_fields(self, class_: Class) -> tuple[str, ...] | None:
+        return self.resolve_slot_fields(class_)
+
+    def extract_fields(self, inst: Instance) -> list[str]:
+        fields: list[str] = []
+        append = fields.append
 
-            if field_name.startswith("__") and not field_name.endswith("__"):
-                field_name = f"_{type(inst).__name__}{field_name}"
+        field_values: Iterable[Any] | None = None
 
+        if self._fields_getter is not None:
             try:
-                field_value = getattr(inst, field_name)
+                field_values = self._fields_getter(inst)
             except AttributeError:
+                pass  # Let the per-field lookup report the missing attribute.
+
+        if field_values is None:
+            field_values = [getattr(inst, field_name, _MISSING) for field_name in self.resolved_fields]
+
+        for (field_name, field_handler), field_value in zip(self._field_plan, field_values):
+            if field_value is _MISSING:
                 if self.skip_missing:
                     continue
 
-                raise AttributeError(f"Missing required attribute: {field_name}") from None
+                raise AttributeError(f"Missing required attribute: {field_name}")
 
-            field_value = self.process_field_value(inst, field_name, field_value)
+            append(f"{field_name}={field_handler(inst, field_value)}")
 
-            yield field_name, field_value
+        return fields
@@ -1,13 +1,19 @@
 from collections.abc import (
     Callable,
+    Hashable,
     Iterable,
     Mapping,
     Sequence
 )
 
+from inspect import getmro
+from keyword import iskeyword
 from typing import Any
+from unicodedata import normalize
+from weakref import ReferenceType, WeakKeyDictionary, ref
 
 from .types import Class, Instance
+from .field_extractors.base_field_extractor import _MISSING
 from .field_extractors import (
     BaseFieldExtractor,
     DictFieldExtractor,
@@ -15,6 +21,13 @@ from .field_extractors import (
     IncludedFieldExtractor
 )
 
+# The latest KWRepr per decorated class. Both sides are weak: the KWRepr is
+# kept alive only by the __repr__ installed on the class, and its options key
+# (which holds user compute/format_spec/repr_config objects that may refer back
+# to the class) is stored on the KWRepr itself. Nothing here can therefore keep
+# a class or a replaced KWRepr alive, and there is at most one entry per class.
+_KWREPR_CACHE: WeakKeyDictionary[Class, ReferenceType["KWRepr"]] = WeakKeyDictionary()
+
 
 class KWRepr:
     """
@@ -25,6 +38,16 @@ class KWRepr:
     computed fields, formatting, and fallback handling.
     """
 
+    __slots__ = (
+        "delimiters",
+        "field_extractor",
+        "_extractor_options",
+        "_field_extractors",
+        "_repr_factory",
+        "_cache_key",
+        "__weakref__"
+    )
+
     DELIMITERS: tuple[str, str] = ("(", ")")
 
     def __init__(
@@ -59,45 +82,98 @@ class KWRepr:
             ValueError: If both `include` and `exclude` are provided.
             TypeError: If the given type does not define `__dict__` or `__slots__`.
         """
-        if include is not None and exclude is not None:
-            raise ValueError("Cannot specify both 'include' and 'exclude'")
+        self.check_options(include, exclude)
 
         self.delimiters = delimiters or self.DELIMITERS
 
-        field_extractor_cls: BaseFieldExtractor = self.resolve_field_extractor(class_or_inst, include)
+        class_: Class = class_or_inst if isinstance(class_or_inst, type) else type(class_or_inst)
 
-        self.field_extractor: BaseFieldExtractor = field_extractor_cls(
-            include=include,
-            exclude=exclude,
-            compute=compute,
-            format_spec=format_spec,
-            exclude_private=exclude_private,
-            skip_missing=skip_missing,
-            repr_config=repr_config
+        self._extractor_options: dict[str, Any] = {
+            "include": include,
+            "exclude": exclude,
+            "compute": compute,
+            "format_spec": format_spec,
+            "exclude_private": exclude_private,
+            "skip_missing": skip_missing,
+            "repr_config": repr_config
+        }
+
+        self.field_extractor: BaseFieldExtractor = self.create_field_extractor(class_)
+
+        # Extractors per concrete class, so subclass instances show their own
+        # fields. Keyed weakly so cached KWRepr objects keep no class alive.
+        self._field_extractors: WeakKeyDictionary[Class, BaseFieldExtractor] = WeakKeyDictionary(
+            {class_: self.field_extractor}
         )
 
-    def generate_body(self, fields: Iterable[tuple[str, str]]) -> str:
+        self._repr_factory = self.compile_repr_factory()
+
+        self._cache_key: Hashable | None = None
+
+    def create_field_extractor(self, class_: Class) -> BaseFieldExtractor:
+        """
+        Create a field extractor for the given class with this object's options.
+
+        Parameters:
+            class_: The class whose fields the extractor resolves.
+
+        Returns:
+            A new BaseFieldExtractor instance.
+
+        Raises:
+            TypeError: If the given type does not define `__dict__` or `__slots__`.
+        """
+        include = self._extractor_options["include"]
+        field_extractor_cls = self.resolve_field_extractor(class_, include)
+
+        return field_extractor_cls(class_, **self._extractor_options)
+
+    def get_field_extractor(self, class_: Class) -> BaseFieldExtractor:
+        """
+        Return the field extractor for the given class, creating it on first use.
+
+        Subclasses of the class this object was created for get their own
+        extractor, since they may declare additional slots or a `__dict__`.
+        An explicit `include` list names the same fields for every subclass,
+        so it shares the original extractor.
+
+        Parameters:
+            class_: The concrete class of the instance being represented.
+
+        Returns:
+            The cached BaseFieldExtractor for `class_`.
+        """
+        field_extractor = self._field_extractors.get(class_)
+
+        if field_extractor is None:
+            if self._extractor_options["include"] is not None:
+                field_extractor = self.field_extractor
+            else:
+                field_extractor = self.create_field_extractor(class_)
+
+            self._field_extractors[class_] = field_extractor
+
+        return field_extractor
+
+    def generate_body(self, fields: Iterable[str]) -> str:
         """
         Generate the comma-separated key=value string for the repr body.
 
         Parameters:
-            fields: Iterable of (name, value_str) pairs.
+            fields: Iterable of 'name=value_str' strings.
 
         Returns:
             A string in the form 'x=val, y=val, ...'.
         """
-        return ", ".join(
-            f"{field_name}={field_value}"
-            for field_name, field_value in fields
-        )
+        return ", ".join(fields)
 
-    def generate_str(self, inst: Instance, fields: Iterable[tuple[str, str]]) -> str:
+    def generate_str(self, inst: Instance, fields: Iterable[str]) -> str:
         """
         Generate the final __repr__ string using provided fields.
 
         Parameters:
             inst: The instance being represented.
-            fields: Iterable of (name, value_str) pairs.
+            fields: Iterable of 'name=value_str' strings.
 
         Returns:
             The full __repr__ string.
@@ -107,9 +183,7 @@ class KWRepr:
 
         body = self.generate_body(fields)
 
-        parts: list[str] = [name, start, body, end]
-
-        return "".join(parts)
+        return f"{name}{start}{body}{end}"
 
     def generate(self, inst: Instance) -> str:
         """
@@ -121,9 +195,155 @@ class KWRepr:
         Returns:
             The full repr string.
         """
-        fields = self.field_extractor.extract_fields(inst)
-        repr_str = self.generate_str(inst, fields)
-        return repr_str
+        inst_class = type(inst)
+        start, end = self.delimiters
+        fields = self.get_field_extractor(inst_class).extract_fields(inst)
+        return f"{inst_class.__qualname__}{start}{', '.join(fields)}{end}"
+
+    @staticmethod
+    def is_plain_identifier(name: str) -> bool:
+        """
+        Check whether `self.<name>` in generated source reads attribute `name`.
+
+        The compiler NFKC-normalizes identifiers while getattr does not, so
+        names that change under normalization (e.g. "ﬁ" -> "fi") must not be
+        compiled.
+
+        Parameters:
+            name: The attribute name.
+
+        Returns:
+            True if the name can be used as a literal attribute access.
+        """
+        return (
+            name.isidentifier()
+            and not iskeyword(name)
+            and normalize("NFKC", name) == name
+        )
+
+    def compile_repr_factory(self) -> Callable[[Class, str], Callable[[Instance], str]] | None:
+        """
+        Compile a factory for __repr__ functions specialized for the fields.
+
+        The field list, computed fields and format specs are resolved once
+        and baked into generated source, so the compiled functions do no
+        per-field filtering or dispatch. The factory takes the target class
+        and the repr prefix, so the generated code itself holds no reference
+        to the class and can be reused when the class is decorated again.
+
+        Returns:
+            The compiled factory, or None if the fields are only known per
+            instance (e.g. for classes with a `__dict__`) or there are none
+            (see `compile_repr`).
+        """
+        field_names = self.field_extractor.resolved_fields
+
+        if not field_names:
+            return None
+        if not all(self.is_plain_identifier(name) for name in field_names):
+            return None
+
+        namespace: dict[str, Any] = {
+            "_generate": self.generate,
+            "_repr": self.field_extractor.repr_field_value,
+            "_end": self.delimiters[1],
+            "_MISSING": _MISSING
+        }
+
+        skip_missing = self.field_extractor.skip_missing
+
+        lines: list[str] = [
+            "def __create_repr__(_class, _prefix):",
+            "    def __repr__(self):",
+            "        if type(self) is not _class:",
+            "            return _generate(self)"
+        ]
+        parts: list[str] = []
+
+        if skip_missing:
+            lines.append("        _parts = []")
+
+        # Each field is read exactly once; a missing one is skipped or
+        # reported right where it is read.
+        for index, field_name in enumerate(field_names):
+            value = f"_{index}"
+            lines.append("        try:")
+            lines.append(f"            {value} = self.{field_name}")
+            lines.append("        except AttributeError:")
+
+            if skip_missing:
+                lines.append(f"            {value} = _MISSING")
+            else:
+                message = repr(f"Missing required attribute: {field_name}")
+                lines.append(f"            raise AttributeError({message}) from None")
+
+            field_value = value
+
+            if field_computer := self.field_extractor.compute.get(field_name):
+                namespace[f"_compute_{index}"] = field_computer
+                field_value = f"_compute_{index}(self)"
+
+            if format_spec := self.field_extractor.format_spec.get(field_name):
+                namespace[f"_format_spec_{index}"] = format_spec
+                field_value = f"format({field_value}, _format_spec_{index})"
+            else:
+                field_value = f"_repr({field_value})"
+
+            part = f"{field_name}={{{field_value}}}"
+
+            if skip_missing:
+                lines.append(f"        if {value} is not _MISSING:")
+                lines.append(f"            _parts.append(f\"{part}\")")
+            else:
+                parts.append(part)
+
+        if skip_missing:
+            lines.append("        return f\"{_prefix}{', '.join(_parts)}{_end}\"")
+        else:
+            body = ", ".join(parts)
+            lines.append(f"        return f\"{{_prefix}}{body}{{_end}}\"")
+
+        lines.append("    return __repr__")
+
+        exec(compile("\n".join(lines), "<kwrepr generated __repr__>", "exec"), namespace)
+
+        return namespace["__create_repr__"]
+
+    def compile_repr(self, class_: Class) -> Callable[[Instance], str] | None:
+        """
+        Create a compiled __repr__ function for the given class.
+
+        Instances of subclasses fall back to `generate`. A class without any fields gets a function
+        returning a precomputed constant.
+
+        Parameters:
+            class_: The class to create the __repr__ function for.
+
+        Returns:
+            The compiled function, or None if the fields are only known
+            per instance (e.g. for classes with a `__dict__`).
+        """
+        field_names = self.field_extractor.resolved_fields
+
+        if field_names is None:
+            return None
+
+        start, end = self.delimiters
+
+        if not field_names:
+            constant_repr = f"{class_.__qualname__}{start}{end}"
+            generate = self.generate
+
+            def _repr(inst: Instance):
+                return constant_repr if type(inst) is class_ else generate(inst)
+        elif self._repr_factory is None:
+            return None
+        else:
+            _repr = self._repr_factory(class_, f"{class_.__qualname__}{start}")
+
+        _repr.__module__ = class_.__module__
+
+        return _repr
 
     @staticmethod
     def resolve_field_extractor(
@@ -133,6 +353,10 @@ class KWRepr:
         """
         Select the appropriate field extractor based on object type.
 
+        Instances get a `__dict__` unless every class in the MRO declares
+        `__slots__` without a `__dict__` slot, so the MRO is inspected
+        rather than the class object itself (which always has one).
+
         Parameters:
             class_or_inst: Class or instance to inspect.
             include: Optional inclusion list to force extractor type.
@@ -148,15 +372,137 @@ class KWRepr:
 
         class_: Class = class_or_inst if isinstance(class_or_inst, type) else type(class_or_inst)
 
-        if hasattr(class_, "__dict__"):
+        mro = getmro(class_)
+
+        if any("__dict__" in vars(base) for base in mro):
             return DictFieldExtractor
-        if hasattr(class_, "__slots__"):
+        if any("__slots__" in vars(base) for base in mro):
             return SlotsFieldExtractor
 
         raise TypeError(
-            f"Type {type(class_).__name__} must define either '__dict__' or '__slots__'"
+            f"Type {class_.__name__} must define either '__dict__' or '__slots__'"
         )
 
+    @staticmethod
+    def make_cache_key(
+        include: Sequence[str] | None = None,
+        exclude: Sequence[str] | None = None,
+        compute: Mapping[str, Callable[[Instance], Any]] | None = None,
+        format_spec: Mapping[str, str] | None = None,
+        exclude_private: bool = True,
+        skip_missing: bool = False,
+        repr_config: Mapping[str, Any] | None = None,
+        delimiters: tuple[str, str] | None = None
+    ) -> Hashable | None:
+        """
+        Build a hashable key identifying a set of KWRepr options.
+
+        Returns:
+            The key, or None if any option value is unhashable.
+        """
+        try:
+            key = (
+                None if include is None else tuple(include),
+                None if exclude is None else tuple(exclude),
+                frozenset((compute or {}).items()),
+                frozenset((format_spec or {}).items()),
+                exclude_private,
+                skip_missing,
+                frozenset((repr_config or {}).items()),
+                delimiters
+            )
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    @staticmethod
+    def check_options(
+        include: Sequence[str] | None = None,
+        exclude: Sequence[str] | None = None
+    ) -> None:
+        """
+        Validate option combinations that can be checked without a class.
+
+        Raises:
+            ValueError: If both `include` and `exclude` are provided.
+        """
+        if include is not None and exclude is not None:
+            raise ValueError("Cannot specify both 'include' and 'exclude'")
+
+    @classmethod
+    def create_repr(
+        cls,
+        class_: Class,
+        include: Sequence[str] | None = None,
+        exclude: Sequence[str] | None = None,
+        compute: Mapping[str, Callable[[Instance], Any]] | None = None,
+        format_spec: Mapping[str, str] | None = None,
+        exclude_private: bool = False,
+        skip_missing: bool = False,
+        repr_config: Mapping[str, Any] | None = None,
+        delimiters: tuple[str, str] | None = None
+    ) -> Callable[[Instance], str]:
+        """
+        Create the __repr__ function for the given class.
+
+        Reuses the most recent KWRepr built for the class if it is still in use
+        and was built with the same options.
+        Takes the same parameters as `inject_repr`.
+
+        Returns:
+            The __repr__ function, ready to be assigned to the class.
+
+        Raises:
+            ValueError: If both `include` and `exclude` are provided.
+            TypeError: If the given type does not define `__dict__` or `__slots__`.
+        """
+        options: dict[str, Any] = {
+            "include": include,
+            "exclude": exclude,
+            "compute": compute,
+            "format_spec": format_spec,
+            "exclude_private": exclude_private,
+            "skip_missing": skip_missing,
+            "repr_config": repr_config,
+            "delimiters": delimiters
+        }
+
+        options_key = cls.make_cache_key(**options)
+        cache_key = None if options_key is None else (cls, options_key)
+
+        kwrepr: KWRepr | None = None
+        if cache_key is not None and (cached_ref := _KWREPR_CACHE.get(class_)) is not None:
+            kwrepr = cached_ref()
+            if kwrepr is not None and kwrepr._cache_key != cache_key:
+                kwrepr = None
+
+        if kwrepr is None:
+            kwrepr = cls(class_or_inst=class_, **options)
+
+            if cache_key is not None:
+                kwrepr._cache_key = cache_key
+                _KWREPR_CACHE[class_] = ref(kwrepr)
+
+        _repr = kwrepr.compile_repr(class_)
+
+        if _repr is None:
+            qualname = class_.__qualname__
+            start, end = kwrepr.delimiters
+            generate = kwrepr.generate
+            extract_fields = kwrepr.field_extractor.extract_fields
+
+            def _repr(inst: Instance):
+                if type(inst) is not class_:
+                    return generate(inst)
+                return f"{qualname}{start}{', '.join(extract_fields(inst))}{end}"
+
+        _repr.__qualname__ = f"{class_.__name__}.__repr__"
+        _repr.__module__ = class_.__module__
+
+        return _repr
+
     @classmethod
     def inject_repr(
         cls,
@@ -173,6 +519,11 @@ class KWRepr:
         """
         Injects a custom __repr__ method into the given class.
 
+        The KWRepr object and the specialized __repr__ are only built on the
+        first call, so classes whose repr is never used cost nothing beyond
+        the option and layout checks. The first call then replaces the
+        injected method on the class with the real one.
+
         Parameters:
             class_: Target class to inject __repr__ into.
             include: List of attribute names to include in repr.
@@ -183,22 +534,39 @@ class KWRepr:
             skip_missing: Whether to ignore missing attributes.
             repr_config: Optional config for reprlib.Repr.
             delimiters: A tuple of two strings used to surround the entire `repr` body. For example, `('(', ')')` would produce `ClassName(field=value)` style.
+
+        Raises:
+            ValueError: If both `include` and `exclude` are provided.
+            TypeError: If the given type does not define `__dict__` or `__slots__`.
         """
-        kwrepr: KWRepr = cls(
-            class_or_inst=class_,
-            include=include,
-            exclude=exclude,
-            compute=compute,
-            format_spec=format_spec,
-            exclude_private=exclude_private,
-            skip_missing=skip_missing,
-            repr_config=repr_config,
-            delimiters=delimiters
-        )
+        cls.check_options(include, exclude)
+        cls.resolve_field_extractor(class_, include)
+
+        created_repr: Callable[[Instance], str] | None = None
 
         def _repr(inst: Instance):
-            return kwrepr.generate(inst)
+            nonlocal created_repr
+
+            if created_repr is None:
+                created_repr = cls.create_repr(
+                    class_,
+                    include=include,
+                    exclude=exclude,
+                    compute=compute,
+                    format_spec=format_spec,
+                    exclude_private=exclude_private,
+                    skip_missing=skip_missing,
+                    repr_config=repr_config,
+                    delimiters=delimiters
+                )
+
+                # Only swap in the real __repr__ if this one is still installed.
+                if class_.__dict__.get("__repr__") is _repr:
+                    class_.__repr__ = created_repr
+
+            return created_repr(inst)
 
         _repr.__qualname__ = f"{class_.__name__}.__repr__"
+        _repr.__module__ = class_.__module__
 
         class_.__repr__ = _repr